@@ -1,7 +1,9 @@
 """ Employee .py file inputting info for the gui"""
 
+from array import array
 from enum import Enum
 import abc
+from itertools import count
 from datetime import date
 from datetime import datetime
 
@@ -25,6 +27,10 @@ class Department(Enum):
     MACHINING = 5
 
 
+_ROLE_BY_VAL = {r.value: r for r in Role}
+_DEPT_BY_VAL = {d.value: d for d in Department}
+
+
 """Defines custom erorr types that can be used to raise errors with Role & Department"""
 
 
@@ -43,47 +49,47 @@ while allowing subclasses to provide their own implementations of the calc_pay()
 
 
 class Employee(abc.ABC):
-    id_number = 0
+    __slots__ = ('name', 'email', 'image', 'id_number')
+    _id_counter = count()
     IMAGE_PLACEHOLDER = "./images/placeholder.png"
 
     def __init__(self, name: str, email: str):
-        self.id_number = Employee.id_number
-        Employee.id_number += 1
-        self.name = name
-        self.email = email
-        self.image = Employee.IMAGE_PLACEHOLDER
-
-    @property
-    def name(self):
-        return self._name
-
-    @name.setter
-    def name(self, name):
+        self.id_number = next(Employee._id_counter)
+        self.name = Employee._validate_name(name)
+        self.email = Employee._validate_email(email)
+        self.image = Employee._validate_image(Employee.IMAGE_PLACEHOLDER)
+
+    # Attributes are plain slots so reads skip property dispatch; writes from
+    # outside the constructor go through the set_* methods to keep validation.
+
+    @staticmethod
+    def _validate_name(name):
         if not name:
             raise ValueError("Name cannot be blank")
-        self._name = name
-
-    @property
-    def email(self):
-        return self._email
+        return name
 
-    @email.setter
-    def email(self, email):
+    @staticmethod
+    def _validate_email(email):
         if not email:
             raise ValueError("Email cannot be blank")
-        if "@acme-machining.com" not in email:
+        if not email.endswith("@acme-machining.com"):
             raise ValueError("Email must be from @acme-machining.com")
-        self._email = email
+        return email
 
-    @property
-    def image(self):
-        return self._image
-
-    @image.setter
-    def image(self, image):
+    @staticmethod
+    def _validate_image(image):
         if not image:
             raise ValueError("Image cannot be empty.")
-        self._image = image
+        return image
+
+    def set_name(self, name):
+        self.name = Employee._validate_name(name)
+
+    def set_email(self, email):
+        self.email = Employee._validate_email(email)
+
+    def set_image(self, image):
+        self.image = Employee._validate_image(image)
 
     def __repr__(self):
         return f"{self.name}, {self.email}, {self.image}"
@@ -103,19 +109,20 @@ and the yearly attribute using the provided yearly argument."""
 
 
 class Salaried(Employee):
+    __slots__ = ('yearly',)
+
     def __init__(self, name: str, email: str, yearly: float):
         super().__init__(name, email)
-        self.yearly = yearly
+        self.yearly = Salaried._validate_yearly(yearly)
 
-    @property
-    def yearly(self):
-        return self._yearly
-
-    @yearly.setter
-    def yearly(self, yearly):
+    @staticmethod
+    def _validate_yearly(yearly):
         if yearly < 50000:
             raise ValueError("Yearly salary must be over $50,000")
-        self._yearly = yearly
+        return yearly
+
+    def set_yearly(self, yearly):
+        self.yearly = Salaried._validate_yearly(yearly)
 
     def calc_pay(self):
         return self.yearly / 52.0
@@ -129,19 +136,20 @@ class Salaried(Employee):
 
 
 class Hourly(Employee):
+    __slots__ = ('hourly_wage',)
+
     def __init__(self, name: str, email: str, hourly_wage: float):
         super().__init__(name, email)
-        self.hourly_wage = hourly_wage
+        self.hourly_wage = Hourly._validate_hourly_wage(hourly_wage)
 
-    @property
-    def hourly_wage(self):
-        return self._hourly_wage
-
-    @hourly_wage.setter
-    def hourly_wage(self, hourly_wage):
+    @staticmethod
+    def _validate_hourly_wage(hourly_wage):
         if hourly_wage < 15 or hourly_wage > 99.99:
             raise ValueError("Hourly wage must be between $15 and $99.99 (inclusive)")
-        self._hourly_wage = hourly_wage
+        return hourly_wage
+
+    def set_hourly_wage(self, hourly_wage):
+        self.hourly_wage = Hourly._validate_hourly_wage(hourly_wage)
 
     def calc_pay(self):
         return self.hourly_wage * 40.0
@@ -158,12 +166,14 @@ such as checking the validity of the role and department values."""
 
 
 class Executive(Salaried):
+    __slots__ = ('role',)
 
     def __init__(self, name: str, email: str, yearly: float, role: int):
         super().__init__(name, email, yearly)
-        if role not in [s.value for s in Role]:
+        role_member = _ROLE_BY_VAL.get(role)
+        if role_member is None:
             raise InvalidRoleException(f"{role} is not a valid role.")
-        self.role = Role(role)
+        self.role = role_member
 
     def __repr__(self):
         base_repr = super().__repr__()
@@ -171,11 +181,14 @@ class Executive(Salaried):
 
 
 class Manager(Salaried):
+    __slots__ = ('department',)
+
     def __init__(self, name: str, email: str, yearly: float, department: Department):
         super().__init__(name, email, yearly)
-        if department not in [d.value for d in Department]:
+        department_member = _DEPT_BY_VAL.get(department)
+        if department_member is None:
             raise InvalidDepartmentException(f"{department} is not a valid department.")
-        self.department = Department(department)
+        self.department = department_member
 
     def __repr__(self):
         base_repr = super().__repr__()
@@ -183,6 +196,8 @@ class Manager(Salaried):
 
 
 class Permanent(Hourly):
+    __slots__ = ('hired_date',)
+
     def __init__(self, name: str, email: str, hourly_wage: float, hired_date: datetime):
         super().__init__(name, email, hourly_wage)
         self.hired_date = hired_date
@@ -193,6 +208,8 @@ class Permanent(Hourly):
 
 
 class Temporary(Hourly):
+    __slots__ = ('last_day',)
+
     def __init__(self, name: str, email: str, hourly_wage: float, last_day: date):
         super().__init__(name, email, hourly_wage)
         self.last_day = last_day
@@ -200,3 +217,59 @@ class Temporary(Hourly):
     def __repr__(self):
         base_repr = super().__repr__()
         return f"{base_repr}, {self.last_day}"
+
+
+"""Holds every employee column by column for display: ids and pay in typed arrays, type, name
+and email in parallel lists.  The Employee objects themselves are kept in a by-id index and
+are what indexing or iterating the table hands back; they stay the source of truth.
+The columns are copies, so refresh(row) must be called after any change to an employee."""
+
+
+class EmployeeTable:
+    def __init__(self, employees=()):
+        self.ids = array('q')
+        self.types = []
+        self.names = []
+        self.emails = []
+        self.pays = array('d')
+        self._by_id = {}
+        self.extend(employees)
+
+    def __len__(self):
+        return len(self.ids)
+
+    def __getitem__(self, row: int) -> Employee:
+        return self._by_id[self.ids[row]]
+
+    def __iter__(self):
+        by_id = self._by_id
+        return (by_id[i] for i in self.ids)
+
+    def append(self, employee: Employee):
+        self.ids.append(employee.id_number)
+        self.types.append(type(employee).__name__)
+        self.names.append(employee.name)
+        self.emails.append(employee.email)
+        self.pays.append(EmployeeTable._pay(employee))
+        self._by_id[employee.id_number] = employee
+
+    def extend(self, employees):
+        for employee in employees:
+            self.append(employee)
+
+    def clear(self):
+        # Cleared in place so views holding on to the columns stay valid.
+        del self.ids[:], self.types[:], self.names[:], self.emails[:], self.pays[:]
+        self._by_id.clear()
+
+    def refresh(self, row: int):
+        """Copy an edited employee's values back into its row.  Required after every
+        mutation of an employee, or the display columns go stale."""
+        employee = self[row]
+        self.names[row] = employee.name
+        self.emails[row] = employee.email
+        self.pays[row] = EmployeeTable._pay(employee)
+
+    @staticmethod
+    def _pay(employee: Employee) -> float:
+        return employee.yearly if isinstance(employee, Salaried) else employee.hourly_wage
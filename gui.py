@@ -9,57 +9,112 @@ Winter 2023
 
 import csv
 
+try:
+    import pandas as pd
+except ImportError:  # pandas is optional; fall back to the csv module
+    pd = None
+
 from PyQt6 import QtWidgets
 from PyQt6.QtCore import QAbstractTableModel
 from PyQt6.QtCore import Qt
-from PyQt6.QtGui import QPixmap, QAction
+from PyQt6.QtCore import pyqtSignal
+from PyQt6.QtGui import QPixmap, QPixmapCache, QAction
 from PyQt6.QtWidgets import QLabel, QLineEdit, QMenu, QHeaderView, QTableView, QMainWindow, QAbstractItemView, \
-    QPushButton, QVBoxLayout, QListWidget, QListWidgetItem, QComboBox
+    QPushButton, QVBoxLayout, QListWidget, QListWidgetItem, QComboBox, QApplication
 
 from employee import *
 from typing import *
 
+# Column names for employee.data, which has no header row.
+_DATA_COLUMNS = ['type', 'name', 'email', 'image', 'pay', 'extra']
+
+# Only pay is numeric; every other column stays text, exactly as the csv module reads it.
+_DATA_DTYPES = {column: str for column in _DATA_COLUMNS}
+_DATA_DTYPES['pay'] = 'float64'
+
+# Maps the type tag at the start of each employee.data row to a constructor for that row.
+_CTORS = {
+    'Executive': lambda r: Executive(r[1], r[2], float(r[4]), int(r[5])),
+    'Manager': lambda r: Manager(r[1], r[2], float(r[4]), int(r[5])),
+    'Temp': lambda r: Temporary(r[1], r[2], float(r[4]), r[5]),
+    'Permanent': lambda r: Permanent(r[1], r[2], float(r[4]), r[5]),
+}
+
+
+def _read_with_csv(path: str) -> List[Employee]:
+    """Parse employee.data with the csv module."""
+    with open(path) as datafile:
+        return [_CTORS[row[0]](row) for row in csv.reader(datafile, quoting=csv.QUOTE_MINIMAL)]
+
+
+def _read_with_pandas(path: str) -> List[Employee]:
+    """Parse employee.data with pandas' C tokenizer.  Produces the same employees as
+    _read_with_csv, including none at all for an empty file."""
+    try:
+        df = pd.read_csv(path, header=None, names=_DATA_COLUMNS, dtype=_DATA_DTYPES, keep_default_na=False)
+    except pd.errors.EmptyDataError:
+        return []
+    return [_CTORS[r.type](r) for r in df.itertuples(index=False)]
+
+
+# Formats a yearly salary or hourly wage for display.  Bound once so building the pay
+# cache skips a Python-level wrapper frame per row.
+_format_pay = '${:,.2f}'.format
+
 
 class HRTableModel(QAbstractTableModel):
     """The HRTableModel allows us to display our information in a QTableView."""
-    def __init__(self, data) -> None:
+    def __init__(self, data: EmployeeTable) -> None:
         super(HRTableModel, self).__init__()
         self._columns = ["ID#", "Type", "Name", "Pay", "Email"]
         self._data = data
+        self._col_count = len(self._columns)
+        self._build_cache()
+
+    def _build_cache(self) -> None:
+        """Pre-format the pay column so data() is a plain lookup; the other columns are
+        read straight out of the EmployeeTable."""
+        data = self._data
+        self._row_count = len(data)
+        self._pay_cache = list(map(_format_pay, data.pays))
+        self._cols = (data.ids, data.types, data.names, self._pay_cache, data.emails)
+
+    def _on_pay_changed(self, row: int) -> None:
+        """Re-format the pay cell of an employee whose pay was just edited."""
+        self._data.refresh(row)
+        self._pay_cache[row] = _format_pay(self._data.pays[row])
+        index = self.index(row, 3)
+        self.dataChanged.emit(index, index)
+
+    def refresh_row(self, row: int) -> None:
+        """Re-read a single edited row and repaint only that row."""
+        self._data.refresh(row)
+        self.dataChanged.emit(self.index(row, 0), self.index(row, self._col_count - 1))
 
     def headerData(self, section: int, orientation: Qt.Orientation, role: int = ...) -> str:
         """Gives the header info in a format PyQt wants."""
-        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+        if role != Qt.ItemDataRole.DisplayRole:
+            return None
+        if orientation == Qt.Orientation.Horizontal:
             # return f"Column {section + 1}"
             return self._columns[section]
-        if orientation == Qt.Orientation.Vertical and role == Qt.ItemDataRole.DisplayRole:
-            return f"{section + 1}"
+        return f"{section + 1}"
 
     def data(self, index, role) -> str:
-        """Returns the data at some table index."""
-        if role == Qt.ItemDataRole.DisplayRole:
-            e = self._data[index.row()]
-            field = e.id_number
-            if index.column() == 1:
-                field = type(e).__name__
-            if index.column() == 2:
-                field = e.name
-            if index.column() == 3:
-                if isinstance(e, Salaried):
-                    field = '${:,.2f}'.format(e.yearly)
-                else:
-                    field = '${:,.2f}'.format(e.hourly_wage)
-            if index.column() == 4:
-                field = e.email
-            return field
-
-    def rowCount(self, index) -> int:
-        """Provides the way for PyQt to get our row count."""
-        return len(self._data)
-
-    def columnCount(self, index) -> int:
+        """Returns the data at some table index.  Qt asks for every role on each repaint,
+        so anything but DisplayRole is rejected with a single comparison."""
+        if role != Qt.ItemDataRole.DisplayRole:
+            return None
+        return self._cols[index.column()][index.row()]
+
+    def rowCount(self, index=None) -> int:
+        """Provides the way for PyQt to get our row count.  Cached, and refreshed
+        whenever the data is reloaded."""
+        return self._row_count
+
+    def columnCount(self, index=None) -> int:
         """Provides the column count, as PyQt expects."""
-        return len(self._columns)
+        return self._col_count
 
 
 class MainWindow(QMainWindow):
@@ -68,7 +123,8 @@ class MainWindow(QMainWindow):
         super().__init__(parent)
         self.setWindowTitle("Employee Management v1.0.0")
         self.resize(800, 600)
-        self._data = []
+        self._data = EmployeeTable()
+        self._model = None
         self.load_file()
         self._model = HRTableModel(self._data)
         self._table = QTableView()
@@ -76,11 +132,19 @@ class MainWindow(QMainWindow):
         self._table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
         self._table.setSelectionMode(QAbstractItemView.SelectionMode.SingleSelection)
         self._table.setAlternatingRowColors(True)
+        # A fixed row height lets Qt size the scroll range without asking the model about every row.
+        self._table.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        self._table.verticalHeader().setDefaultSectionSize(22)
         self._header = self._table.horizontalHeader()
         self._header.setSectionResizeMode(4, QHeaderView.ResizeMode.Stretch)
         self.setCentralWidget(self._table)
         self._create_menu_bar()
         self._employee_form = None
+        # One form per employee type, built once and refilled on every edit.
+        self._forms = {Executive: ExecutiveForm(self), Manager: ManagerForm(self),
+                       Permanent: PermanentForm(self), Temporary: TempForm(self)}
+        for form in self._forms.values():
+            form.pay_changed.connect(self._model._on_pay_changed)
         self._about_form = AboutForm()
 
     def _create_menu_bar(self) -> None:
@@ -91,7 +155,7 @@ class MainWindow(QMainWindow):
         edit_menu = QMenu("&Edit", self)
         help_menu = QMenu("&Help", self)
         self._exit_action = QAction("&Exit")
-        self._exit_action.triggered.connect(exit)
+        self._exit_action.triggered.connect(QApplication.instance().quit)
         self._load_action = QAction("&Load HR Data")
         self._save_action = QAction("&Save HR Data")
         self._save_action.setShortcut('Ctrl+S')
@@ -117,19 +181,12 @@ class MainWindow(QMainWindow):
         """Our 'help' form merely shows who wrote this, the version, and a description."""
         self._about_form.show()
 
-    def data_to_rows(self) -> List[str]:
+    def data_to_rows(self) -> List[Tuple[int, str, str, str, str]]:
         """It is sometimes useful for us to have our model data as a list.  This method
         provides that feature."""
-        data = []
-        for e in self._data:
-            row = [e.id_number, type(e).__name__, e.name]
-            if isinstance(e, Salaried):
-                row.append(str(e.yearly))
-            else:
-                row.append(str(e.hourly))
-            row.append(e.email)
-            data.append(row)
-        return data
+        return [(e.id_number, type(e).__name__, e.name,
+                 str(e.yearly) if isinstance(e, Salaried) else str(e.hourly_wage), e.email)
+                for e in self._data]
 
     def refresh_width(self) -> None:
         """Resize our table to fit our data width."""
@@ -142,62 +199,40 @@ class MainWindow(QMainWindow):
         if not index:
             return
         index = index[0].row()
-        if isinstance(self._data[index], Executive):
-            self._employee_form = ExecutiveForm(self)
-        if isinstance(self._data[index], Manager):
-            self._employee_form = ManagerForm(self)
-        if isinstance(self._data[index], Permanent):
-            self._employee_form = PermanentForm(self)
-        if isinstance(self._data[index], Temporary):
-            self._employee_form = TempForm(self)
-
+        self._employee_form = self._forms[type(self._data[index])]
         self._employee_form.fill_in(index)
         self._employee_form.show()
 
     def load_file(self) -> None:
         """Read a representation of all of our Employees from a file and store in our
         _data variable.  The table will automatically be populated by this variable."""
-        with open('./employee.data') as datafile:
-            reader = csv.reader(datafile, quoting=csv.QUOTE_MINIMAL)
-            for row in reader:
-                type = row[0]
-                name = row[1]
-                email = row[2]
-                _image = row[3]
-                if type == 'Executive':
-                    salary = float(row[4])
-                    role = int(row[5])
-                    employee = Executive(name, email, salary, role)
-                if type == 'Manager':
-                    salary = float(row[4])
-                    department = int(row[5])
-                    print(Department.ACCOUNTING.value == 1)
-                    employee = Manager(name, email, salary, department)
-                if type == 'Temp':
-                    hourly = float(row[4])
-                    last_day = row[5]
-                    employee = Temporary(name, email, hourly, last_day)
-                if type == 'Permanent':
-                    hourly = float(row[4])
-                    hired_date = row[5]
-                    employee = Permanent(name, email, hourly, hired_date)
-                print(employee)
-                self._data.append(employee)
+        if self._model is not None:
+            self._model.beginResetModel()
+        try:
+            self._data.clear()
+            read = _read_with_pandas if pd is not None else _read_with_csv
+            self._data.extend(read('./employee.data'))
+        finally:
+            if self._model is not None:
+                self._model._build_cache()
+                self._model.endResetModel()
 
     def save_file(self) -> None:
         """Save a representation of all the Employees to a file."""
-        file = open("./employee.data", "w")
-        for employee in self._data:
-            file.write(type(employee).__name__+','+employee.__repr__()+'\n')
+        with open("./employee.data", "w", buffering=1 << 20) as file:
+            file.write(''.join(f'{type(e).__name__},{e!r}\n' for e in self._data))
 
 
 class EmployeeForm(QtWidgets.QWidget):
     """There will never be a generic employee form, but we don't want to repeat code,
     so we put it all here.  Each subtype of form will add to it."""
+    pay_changed = pyqtSignal(int)
+
     def __init__(self, parent=None, employee: Employee = None, *args, **kwargs) -> None:
         super().__init__(*args, **kwargs)
         self._parent = parent   # missing in student version
         self._employee = employee   # missing in student version
+        self._row = None
         outer_layout = QVBoxLayout()
         self.layout = QtWidgets.QFormLayout()
         self.setLayout(outer_layout)
@@ -222,9 +257,10 @@ class EmployeeForm(QtWidgets.QWidget):
     def update_employee(self) -> None:
         """Change the selected employee's data to the updated values."""
         try:
-            self._employee.name = self._name_edit.text()
-            self._employee.email = self._email_edit.text()
-            self._employee.image = self._image_path_edit.text()
+            self._employee.set_name(self._name_edit.text())
+            self._employee.set_email(self._email_edit.text())
+            self._employee.set_image(self._image_path_edit.text())
+            self._parent._model.refresh_row(self._row)
             self._parent.refresh_width()
             self.setVisible(False)
         except ValueError as message:
@@ -233,13 +269,18 @@ class EmployeeForm(QtWidgets.QWidget):
     def fill_in(self, index) -> None:
         """Upon opening the form, we wish to add the selected employee's data
         to the fields."""
+        self._row = index
         self._employee = self._parent._data[index]
         self.setWindowTitle("Edit " + type(self._employee).__name__ + " Employee Information")
         self._id_label.setText(str(self._employee.id_number))
         self._name_edit.setText(self._employee.name)
         self._email_edit.setText(self._employee.email)
         self._image_path_edit.setText(self._employee.image)
-        self._image.setPixmap(QPixmap(self._employee.image))
+        pixmap = QPixmapCache.find(self._employee.image)
+        if pixmap is None:
+            pixmap = QPixmap(self._employee.image)
+            QPixmapCache.insert(self._employee.image, pixmap)
+        self._image.setPixmap(pixmap)
 
 # Complete the following forms so that they update and fill-in
 # their custom information.
@@ -247,16 +288,20 @@ class EmployeeForm(QtWidgets.QWidget):
 
 class SalariedForm(EmployeeForm):
 
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.salary_label = QLabel("Salary:", self)
+        self.layout.addRow(self.salary_label, self._pay_edit)
+
     def fill_in(self, index):
         super().fill_in(index)
-        self.salary_label = QLabel("Salary:", self)
         self._pay_edit.setText(str(self._employee.yearly))
-        self.layout.addRow(self.salary_label, self._pay_edit)
 
     def update_employee(self) -> None:
         try:
             super().update_employee()
-            self._employee.yearly = float(self._pay_edit.text())
+            self._employee.set_yearly(float(self._pay_edit.text()))
+            self.pay_changed.emit(self._row)
             print("updated_yearly")
             self._parent.refresh_width()
             self.setVisible(False)
@@ -266,15 +311,17 @@ class SalariedForm(EmployeeForm):
 
 class ExecutiveForm(SalariedForm):
 
-    def fill_in(self, index):
-        super().fill_in(index)
+    def __init__(self, parent=None):
+        super().__init__(parent)
         self.role = QComboBox(self)
         for role in Role:
             self.role.addItem(role.name)
-        self.layout.addRow(self.salary_label, self._pay_edit)
-
         self.layout.addRow(QLabel("Role", self), self.role)
 
+    def fill_in(self, index):
+        super().fill_in(index)
+        self.role.setCurrentText(self._employee.role.name)
+
     def update_employee(self) -> None:
         try:
             super().update_employee()
@@ -287,29 +334,34 @@ class ExecutiveForm(SalariedForm):
 
 class ManagerForm(SalariedForm):
 
-    def fill_in(self, index):
-        super().fill_in(index)
-        self.salary_label = QLabel("Salary:", self)
-        self._pay_edit = QLineEdit(self)
+    def __init__(self, parent=None):
+        super().__init__(parent)
         self.dept = QComboBox(self)
         for dept in Department:
             self.dept.addItem(dept.name)
-
         self.layout.addRow(QLabel("Department", self), self.dept)
 
+    def fill_in(self, index):
+        super().fill_in(index)
+        self.dept.setCurrentText(self._employee.department.name)
+
 
 class HourlyForm(EmployeeForm):
 
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.hourly_wage = QLabel('Hourly wage:')
+        self.layout.addRow(self.hourly_wage, self._pay_edit)
+
     def fill_in(self, index):
         super().fill_in(index)
-        self.hourly_wage = QLabel('Hourly wage:')
         self._pay_edit.setText(str(self._employee.hourly_wage))
-        self.layout.addRow(self.hourly_wage, self._pay_edit)
 
     def update_employee(self) -> None:
         try:
             super().update_employee()
-            self._employee.hourly_wage = float(self._pay_edit.text())
+            self._employee.set_hourly_wage(float(self._pay_edit.text()))
+            self.pay_changed.emit(self._row)
             print("updated_hourly")
             self._parent.refresh_width()
             self.setVisible(False)
@@ -323,15 +375,14 @@ the employee's name, address, hourly pay rate, hourly wage, and last day of work
 
 class TempForm(HourlyForm):
 
-    def __init__(self, employee=None):
-        super().__init__(employee)
-        self.hourly_wage_label = QLabel('Hourly')
+    def __init__(self, parent=None):
+        super().__init__(parent)
         self.last_day_label = QLabel()
-        self.layout.addWidget(QLabel('Last day:'))
+        self.layout.addRow(QLabel('Last day:'), self.last_day_label)
 
     def fill_in(self, index):
         super().fill_in(index)
-        self.layout.addRow(QLabel("Last Day " + str(self._employee.last_day)))
+        self.last_day_label.setText(str(self._employee.last_day))
 
 
 """creates a form for editing permanent employees that includes fields for the employee's 
@@ -340,13 +391,14 @@ name, address, and hourly pay rate, as well as their hire date and salary."""
 
 class PermanentForm(HourlyForm):
 
-    # def __init__(self, parent=None):
-    #     super().__init__(parent)
-    #     # self.file_path = file_path
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.hired_date_label = QLabel()
+        self.layout.addRow(QLabel('Hired date:'), self.hired_date_label)
 
     def fill_in(self, index):
         super().fill_in(index)
-        self.layout.addRow(QLabel("Hired date: " + str(self._employee.hired_date)))
+        self.hired_date_label.setText(str(self._employee.hired_date))
 
 
 class AboutForm(QtWidgets.QWidget):
@@ -0,0 +1,81 @@
+import pytest
+
+from employee import Department, EmployeeTable, Executive, InvalidDepartmentException, \
+    InvalidRoleException, Manager, Temporary
+
+
+def test_calc_pay_follows_direct_yearly_writes():
+    e = Executive("Ana", "ana@acme-machining.com", 52000.0, 1)
+    assert e.calc_pay() == 1000.0
+    e.set_yearly(104000.0)
+    assert e.calc_pay() == 2000.0
+    e.yearly = 208000.0
+    assert e.calc_pay() == 4000.0
+
+
+def test_calc_pay_follows_direct_hourly_wage_writes():
+    t = Temporary("Jason", "jason@acme-machining.com", 20.0, "2023-05-01")
+    assert t.calc_pay() == 800.0
+    t.hourly_wage = 30.0
+    assert t.calc_pay() == 1200.0
+
+
+def make_table():
+    return EmployeeTable([
+        Executive("Ana", "ana@acme-machining.com", 60000.0, 2),
+        Temporary("Jason", "jason@acme-machining.com", 20.0, "2023-05-01"),
+    ])
+
+
+def test_employee_table_append_and_extend_fill_every_column():
+    table = make_table()
+    manager = Manager("Hen", "hen@acme-machining.com", 85000.0, 3)
+    table.append(manager)
+
+    assert len(table) == 3
+    assert table.types == ["Executive", "Temporary", "Manager"]
+    assert table.names == ["Ana", "Jason", "Hen"]
+    assert table.emails == ["ana@acme-machining.com", "jason@acme-machining.com", "hen@acme-machining.com"]
+    assert list(table.pays) == [60000.0, 20.0, 85000.0]
+    assert table.ids[2] == manager.id_number
+
+
+def test_employee_table_getitem_and_iter_follow_row_order():
+    employees = [Temporary("T%d" % i, "t%d@acme-machining.com" % i, 20.0, "2023-05-01") for i in range(4)]
+    table = EmployeeTable(employees)
+
+    assert [table[row] for row in range(4)] == employees
+    assert list(table) == employees
+
+
+def test_employee_table_clear_keeps_column_identity():
+    table = make_table()
+    columns = (table.ids, table.types, table.names, table.emails, table.pays)
+    table.clear()
+
+    assert len(table) == 0
+    assert all(len(column) == 0 for column in columns)
+    assert all(a is b for a, b in zip((table.ids, table.types, table.names, table.emails, table.pays), columns))
+
+    table.extend(make_table())
+    assert columns[2] == ["Ana", "Jason"]
+
+
+def test_employee_table_refresh_resyncs_a_mutated_row():
+    table = make_table()
+    table[1].set_name("Jay")
+    table[1].set_hourly_wage(30.0)
+    assert table.names[1] == "Jason"
+
+    table.refresh(1)
+    assert table.names[1] == "Jay"
+    assert table.pays[1] == 30.0
+    assert table.names[0] == "Ana"
+
+
+def test_invalid_role_and_department_are_rejected():
+    with pytest.raises(InvalidRoleException):
+        Executive("Ana", "ana@acme-machining.com", 60000.0, 9)
+    with pytest.raises(InvalidDepartmentException):
+        Manager("Hen", "hen@acme-machining.com", 85000.0, 0)
+    assert Manager("Hen", "hen@acme-machining.com", 85000.0, 3).department is Department.HR
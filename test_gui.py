@@ -0,0 +1,83 @@
+import os
+
+import pytest
+
+pytest.importorskip("PyQt6")
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt6.QtWidgets import QApplication
+
+from employee import EmployeeTable, Permanent, Temporary
+from gui import HRTableModel
+
+
+@pytest.fixture(scope="module")
+def app():
+    return QApplication.instance() or QApplication([])
+
+
+def make_employees(count, wage):
+    return [Permanent("Pat", "pat@acme-machining.com", wage, "2023-03-02") for _ in range(count)]
+
+
+def test_reload_rebuilds_pay_cache(app):
+    data = EmployeeTable(make_employees(12, 99.99))
+    model = HRTableModel(data)
+
+    model.beginResetModel()
+    data.clear()
+    data.extend(make_employees(6, 20.0))
+    model._build_cache()
+    model.endResetModel()
+
+    assert model.rowCount() == 6
+    assert model._pay_cache == ["$20.00"] * 6
+
+
+def test_pay_edit_reformats_only_that_row(app):
+    data = EmployeeTable(make_employees(3, 20.0))
+    model = HRTableModel(data)
+    data[0].set_hourly_wage(30.0)
+    model._on_pay_changed(0)
+
+    assert model._pay_cache == ["$30.00", "$20.00", "$20.00"]
+
+
+def test_pandas_and_csv_parsers_agree_on_employee_data():
+    pytest.importorskip("pandas")
+    from gui import _read_with_csv, _read_with_pandas
+
+    by_csv = EmployeeTable(_read_with_csv("./employee.data"))
+    by_pandas = EmployeeTable(_read_with_pandas("./employee.data"))
+
+    assert by_pandas.types == by_csv.types
+    assert by_pandas.names == by_csv.names
+    assert by_pandas.emails == by_csv.emails
+    assert list(by_pandas.pays) == list(by_csv.pays)
+    assert [repr(e) for e in by_pandas] == [repr(e) for e in by_csv]
+
+
+def test_pandas_parser_accepts_empty_and_numeric_text(tmp_path):
+    pytest.importorskip("pandas")
+    from gui import _read_with_csv, _read_with_pandas
+
+    empty = tmp_path / "empty.data"
+    empty.write_text("")
+    assert _read_with_pandas(str(empty)) == _read_with_csv(str(empty)) == []
+
+    numeric = tmp_path / "numeric.data"
+    numeric.write_text("Permanent,12345,1@acme-machining.com,./images/placeholder.png,24.56,2023-03-02\n")
+    (employee,) = _read_with_pandas(str(numeric))
+    assert employee.name == "12345"
+
+
+def test_data_to_rows_handles_hourly_employees(app):
+    from types import SimpleNamespace
+    from gui import MainWindow
+
+    temp = Temporary("Jason", "jason@acme-machining.com", 15.67, "2023-05-01")
+    window = SimpleNamespace(_data=EmployeeTable([temp]))
+
+    assert MainWindow.data_to_rows(window) == [
+        (temp.id_number, "Temporary", "Jason", "15.67", "jason@acme-machining.com"),
+    ]